@@ -1,25 +1,25 @@
+import gzip
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    import brotli  # type: ignore
+except ImportError:  # optional; the Pages workflow only has the stdlib
+    brotli = None
 
-def main() -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    output_dir = repo_root / "site"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Ensure GitHub Pages does not run Jekyll
-    (output_dir / ".nojekyll").write_text("", encoding="utf-8")
-
-    updated = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
-
-    html = """<!DOCTYPE html>
+_HTML = """<!DOCTYPE html>
 <html lang=\"en\">
 <head>
 <meta charset=\"utf-8\" />
 <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
 <title>Routes: Springfield, VA → Silver Spring, MD</title>
+<link rel=\"dns-prefetch\" href=\"//unpkg.com\" />
+<link rel=\"preconnect\" href=\"https://router.project-osrm.org\" crossorigin=\"\" />
+<link rel=\"preload\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" as=\"script\" integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"\" />
+<link rel=\"preload\" href=\"https://unpkg.com/leaflet-routing-machine@3.2.12/dist/leaflet-routing-machine.js\" as=\"script\" crossorigin=\"\" />
+<link rel=\"preload\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" as=\"style\" integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"\" />
 <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"\"/>
-<link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet-routing-machine@latest/dist/leaflet-routing-machine.css\" />
+<link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet-routing-machine@3.2.12/dist/leaflet-routing-machine.css\" crossorigin=\"\" />
 <style>
   html, body { height: 100%; margin: 0; padding: 0; }
   body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Helvetica Neue', Arial, 'Noto Sans', sans-serif; color: #0f172a; background: #ffffff; }
@@ -45,7 +45,7 @@ def main() -> None:
   <div id=\"map\"></div>
 
   <script src=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"\"></script>
-  <script src=\"https://unpkg.com/leaflet-routing-machine@latest/dist/leaflet-routing-machine.js\"></script>
+  <script src=\"https://unpkg.com/leaflet-routing-machine@3.2.12/dist/leaflet-routing-machine.js\" crossorigin=\"\"></script>
   <script>
     const start = [38.7893, -77.1872]; // Springfield, VA
     const end = [38.9907, -77.0261];   // Silver Spring, MD
@@ -119,10 +119,31 @@ def main() -> None:
 </html>
 """
 
-    html = html.replace("UPDATED_TIMESTAMP", updated)
+# Split once around the build timestamp slot. The title contains non-ASCII
+# characters, so the static halves are encoded as UTF-8 rather than ASCII.
+_HEAD, _TAIL = (part.encode("utf-8") for part in _HTML.split("UPDATED_TIMESTAMP"))
+
+
+def main() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    output_dir = repo_root / "site"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Ensure GitHub Pages does not run Jekyll
+    (output_dir / ".nojekyll").write_text("", encoding="utf-8")
+
+    updated = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+
+    data = _HEAD + updated.encode("utf-8") + _TAIL
+
+    # Buffered writes either write everything or raise, so a full disk cannot
+    # leave a silently truncated page
+    (output_dir / "index.html").write_bytes(data)
 
-    output_path = output_dir / "index.html"
-    output_path.write_text(html, encoding="utf-8")
+    # Precompressed copies for servers/CDNs that can serve them directly
+    (output_dir / "index.html.gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        (output_dir / "index.html.br").write_bytes(brotli.compress(data, quality=11))
 
 
 if __name__ == "__main__":
@@ -1,158 +1,252 @@
 """Configuration management for Pathypotomus."""
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Dict, FrozenSet, Literal, Mapping, Optional, Tuple, get_args
 
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+_LOG_LEVELS: FrozenSet[str] = frozenset(get_args(LogLevel))
 
-class Config(BaseModel):
-    """Application configuration model with validation."""
+
+def _to_bool(value: str) -> bool:
+    """Interpret common truthy strings from the environment."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Map environment variables to config fields
+_ENV_MAPPING: Dict[str, str] = {
+    'ORIGIN_ADDR': 'origin_addr',
+    'DEST_ADDR': 'dest_addr',
+    'OSRM_URL': 'osrm_url',
+    'LLM_API_KEY': 'llm_api_key',
+    'LLM_MODEL': 'llm_model',
+    'LLM_PROVIDER': 'llm_provider',
+    'OUTPUT_PATH': 'output_path',
+    'OUTPUT_TITLE': 'output_title',
+    'LOG_LEVEL': 'log_level',
+    'ENABLE_DEBUG_MODE': 'enable_debug_mode',
+    'MAX_ROUTES': 'max_routes',
+    'REQUEST_TIMEOUT': 'request_timeout',
+}
+
+# Converters for fields that are not plain strings
+_COERCE: Dict[str, Callable[[str], object]] = {
+    'enable_debug_mode': _to_bool,
+    'max_routes': int,
+    'request_timeout': int,
+}
+
+_REQUIRED_ENV_VARS = ('ORIGIN_ADDR', 'DEST_ADDR')
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Application configuration with validation.
+    
+    Attributes:
+        origin_addr: Origin address for route planning
+        dest_addr: Destination address for route planning
+        osrm_url: OSRM server URL
+        llm_api_key: API key for LLM service
+        llm_model: LLM model to use
+        llm_provider: LLM provider
+        output_path: Output path for generated HTML
+        output_title: Title for generated HTML
+        log_level: Logging level
+        enable_debug_mode: Enable debug mode
+        max_routes: Maximum number of routes to generate (1 to 10)
+        request_timeout: Request timeout in seconds
+    """
     
     # Required configuration
-    origin_addr: str = Field(..., description="Origin address for route planning")
-    dest_addr: str = Field(..., description="Destination address for route planning")
+    origin_addr: str
+    dest_addr: str
     
     # Optional configuration with defaults
-    osrm_url: str = Field(
-        default="https://router.project-osrm.org",
-        description="OSRM server URL"
-    )
-    llm_api_key: Optional[str] = Field(
-        default=None,
-        description="API key for LLM service"
-    )
-    llm_model: str = Field(
-        default="gpt-3.5-turbo",
-        description="LLM model to use"
-    )
-    llm_provider: str = Field(
-        default="openai",
-        description="LLM provider"
-    )
-    output_path: str = Field(
-        default="./output/routes.html",
-        description="Output path for generated HTML"
-    )
-    output_title: str = Field(
-        default="Route Options",
-        description="Title for generated HTML"
-    )
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
-        default="INFO",
-        description="Logging level"
-    )
-    enable_debug_mode: bool = Field(
-        default=False,
-        description="Enable debug mode"
-    )
-    max_routes: int = Field(
-        default=3,
-        ge=1,
-        le=10,
-        description="Maximum number of routes to generate"
-    )
-    request_timeout: int = Field(
-        default=30,
-        ge=1,
-        description="Request timeout in seconds"
-    )
+    osrm_url: str = "https://router.project-osrm.org"
+    llm_api_key: Optional[str] = None
+    llm_model: str = "gpt-3.5-turbo"
+    llm_provider: str = "openai"
+    output_path: str = "./output/routes.html"
+    output_title: str = "Route Options"
+    log_level: LogLevel = "INFO"
+    enable_debug_mode: bool = False
+    max_routes: int = 3
+    request_timeout: int = 30
     
-    model_config = ConfigDict(env_prefix="", case_sensitive=False)
+    def __post_init__(self) -> None:
+        """
+        Validate field values.
         
-    @field_validator('origin_addr', 'dest_addr')
-    @classmethod
-    def validate_addresses(cls, v):
-        """Validate that addresses are not empty."""
-        if not v or not v.strip():
-            raise ValueError("Address cannot be empty")
-        return v.strip()
+        Raises:
+            ValueError: If a field is invalid; the message starts with its name
+        """
+        # Addresses must not be empty and are stored stripped
+        for name in ('origin_addr', 'dest_addr'):
+            value = getattr(self, name)
+            if not value or not value.strip():
+                raise ValueError(f"{name}: Address cannot be empty")
+            object.__setattr__(self, name, value.strip())
+        
+        if not self.osrm_url.startswith(('http://', 'https://')):
+            raise ValueError("osrm_url: OSRM URL must start with http:// or https://")
+        if not self.output_path:
+            raise ValueError("output_path: Output path cannot be empty")
+        # Level names are case-insensitive and stored upper-case
+        log_level = self.log_level.upper() if isinstance(self.log_level, str) else self.log_level
+        if log_level not in _LOG_LEVELS:
+            raise ValueError(f"log_level: Must be one of {', '.join(get_args(LogLevel))}")
+        object.__setattr__(self, 'log_level', log_level)
+        if not 1 <= self.max_routes <= 10:
+            raise ValueError("max_routes: Must be between 1 and 10")
+        if self.request_timeout < 1:
+            raise ValueError("request_timeout: Must be at least 1 second")
     
-    @field_validator('osrm_url')
     @classmethod
-    def validate_osrm_url(cls, v):
-        """Validate OSRM URL format."""
-        if not v.startswith(('http://', 'https://')):
-            raise ValueError("OSRM URL must start with http:// or https://")
-        return v
+    def _from_sources(cls, env_file_values: Mapping[str, str], environ: Mapping[str, str]) -> 'Config':
+        """Build configuration from .env file values and environment values."""
+        config_data = {}
+        for env_var, config_key in _ENV_MAPPING.items():
+            # Environment variables take precedence over file values, even
+            # when set to an empty string
+            value = environ.get(env_var)
+            if value is None:
+                value = env_file_values.get(env_var)
+            
+            if value is not None:
+                try:
+                    config_data[config_key] = _COERCE.get(config_key, str)(value)
+                except ValueError:
+                    raise ValueError(f"Invalid integer value for {env_var}: {value}")
+        
+        missing = [var for var in _REQUIRED_ENV_VARS if _ENV_MAPPING[var] not in config_data]
+        if missing:
+            raise ValueError(f"Missing required configuration: {', '.join(missing)}")
+        
+        return cls(**config_data)
     
-    @field_validator('output_path')
-    @classmethod
-    def validate_output_path(cls, v):
-        """Validate output path."""
-        if not v:
-            raise ValueError("Output path cannot be empty")
-        # Ensure directory exists
-        output_dir = Path(v).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return v
+    def ensure_output_dir(self) -> None:
+        """Create the parent directory of the output path if it does not exist."""
+        Path(self.output_path).parent.mkdir(parents=True, exist_ok=True)
 
 
-def load_config(env_file: Optional[str] = None) -> Config:
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, stamp: Tuple[int, int]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse KEY=VALUE lines from an env file.
+    
+    Supports blank lines, # comments, an optional ``export`` prefix, single or
+    double quoted values and trailing comments. Cached on the file's absolute
+    path and its ``_file_stamp``.
+    """
+    values: Dict[str, str] = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        
+        key, _, value = line.partition("=")
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        
+        value = value.strip()
+        if value[:1] in ('"', "'") and value.find(value[0], 1) != -1:
+            value = value[1:value.find(value[0], 1)]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        
+        values[key] = value
+    return tuple(sorted(values.items()))
+
+
+def _resolve_env_file(env_file: Optional[str]) -> Optional[str]:
+    """Return the env file to read: the given one, else the first default that exists."""
+    if env_file:
+        return env_file
+    # Try default .env file locations
+    for env_path in ['.env', '.env.dev', '.env.local']:
+        if Path(env_path).exists():
+            return env_path
+    return None
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    """
+    Return (modification time, size) for a file.
+    
+    The size catches edits made within the filesystem's timestamp
+    granularity, which leave the modification time unchanged.
+    
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_env_file(path: str) -> Dict[str, str]:
+    """Read env file values, re-parsing only when the file has changed."""
+    try:
+        stamp = _file_stamp(path)
+    except OSError:
+        return {}
+    return dict(_parse_env_file(os.path.abspath(path), stamp))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    env_path: Optional[str],
+    env_file_stamp: Optional[Tuple[int, int]],
+    environ_values: Tuple[Optional[str], ...],
+) -> Config:
+    """Build a Config; cached on every input that can change the result."""
+    env_file_values = _read_env_file(env_path) if env_path else {}
+    environ = {var: value for var, value in zip(_ENV_MAPPING, environ_values) if value is not None}
+    return Config._from_sources(env_file_values, environ)
+
+
+def load_config(
+    env_file: Optional[str] = None,
+    overrides: Optional[Mapping[str, Optional[str]]] = None,
+) -> Config:
     """
     Load configuration from environment variables and .env file.
     
-    Environment variables take precedence over .env file values.
+    Sources are merged in order defaults < .env file < environment variables
+    < overrides. Config is immutable, so the result is cached and shared
+    between callers; it is rebuilt whenever the env file's modification time
+    or size, or any of the configuration environment variables or overrides
+    change.
     
     Args:
         env_file: Path to .env file. If None, uses default locations.
+        overrides: Values keyed by environment variable name (e.g.
+            ``ORIGIN_ADDR``) that take precedence over the environment without
+            modifying it. A value of None hides the environment variable.
         
     Returns:
         Config: Validated configuration object
         
     Raises:
-        ValidationError: If configuration is invalid
+        ValueError: If configuration is missing or invalid
     """
-    # First, collect values from .env file
-    env_file_values = {}
+    env_path = _resolve_env_file(env_file)
+    env_file_stamp = None
+    if env_path:
+        try:
+            env_path = os.path.abspath(env_path)
+            env_file_stamp = _file_stamp(env_path)
+        except OSError:
+            env_path = None
     
-    if env_file:
-        if Path(env_file).exists():
-            # Load env file values without setting environment variables
-            from dotenv import dotenv_values
-            env_file_values = dotenv_values(env_file)
+    if overrides:
+        environ_values = tuple(
+            overrides[var] if var in overrides else os.environ.get(var) for var in _ENV_MAPPING
+        )
     else:
-        # Try default .env file locations
-        from dotenv import dotenv_values
-        for env_path in ['.env', '.env.dev', '.env.local']:
-            if Path(env_path).exists():
-                env_file_values = dotenv_values(env_path)
-                break
-    
-    # Extract configuration from environment variables and file values
-    config_data = {}
-    
-    # Map environment variables to config fields
-    env_mapping = {
-        'ORIGIN_ADDR': 'origin_addr',
-        'DEST_ADDR': 'dest_addr',
-        'OSRM_URL': 'osrm_url',
-        'LLM_API_KEY': 'llm_api_key',
-        'LLM_MODEL': 'llm_model',
-        'LLM_PROVIDER': 'llm_provider',
-        'OUTPUT_PATH': 'output_path',
-        'OUTPUT_TITLE': 'output_title',
-        'LOG_LEVEL': 'log_level',
-        'ENABLE_DEBUG_MODE': 'enable_debug_mode',
-        'MAX_ROUTES': 'max_routes',
-        'REQUEST_TIMEOUT': 'request_timeout',
-    }
-    
-    for env_var, config_key in env_mapping.items():
-        # Environment variables take precedence over file values
-        value = os.getenv(env_var) or env_file_values.get(env_var)
-        
-        if value is not None:
-            # Convert string values to appropriate types
-            if config_key in ['enable_debug_mode']:
-                config_data[config_key] = value.lower() in ('true', '1', 'yes', 'on')
-            elif config_key in ['max_routes', 'request_timeout']:
-                try:
-                    config_data[config_key] = int(value)
-                except ValueError:
-                    raise ValueError(f"Invalid integer value for {env_var}: {value}")
-            else:
-                config_data[config_key] = value
-    
-    return Config(**config_data)
\ No newline at end of file
+        environ_values = tuple(os.environ.get(var) for var in _ENV_MAPPING)
+    return _load_config_cached(env_path, env_file_stamp, environ_values)
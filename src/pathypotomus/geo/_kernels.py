@@ -0,0 +1,135 @@
+"""Batch geodesic kernels.
+
+``haversine_batch`` and ``decode_polyline`` are compiled with Numba when it
+is installed and fall back to NumPy / plain Python implementations otherwise.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover - numba is an optional accelerator
+    njit = None  # type: ignore
+
+# Twice the mean Earth radius in kilometers
+_EARTH_DIAMETER_KM = 12742.0
+_DEG = math.pi / 180.0
+_HALF_DEG = _DEG * 0.5
+
+
+def _haversine_loop(lat1, lon1, lat2, lon2, out):
+    for i in prange(lat1.shape[0]):
+        a = lat1[i] * _DEG
+        b = lat2[i] * _DEG
+        s1 = math.sin((lat2[i] - lat1[i]) * _HALF_DEG)
+        s2 = math.sin((lon2[i] - lon1[i]) * _HALF_DEG)
+        h = s1 * s1 + math.cos(a) * math.cos(b) * s2 * s2
+        out[i] = _EARTH_DIAMETER_KM * math.asin(math.sqrt(min(h, 1.0)))
+    return out
+
+
+def _haversine_numpy(lat1, lon1, lat2, lon2, out):
+    s1 = np.sin((lat2 - lat1) * _HALF_DEG)
+    s2 = np.sin((lon2 - lon1) * _HALF_DEG)
+    h = s1 * s1 + np.cos(lat1 * _DEG) * np.cos(lat2 * _DEG) * s2 * s2
+    np.minimum(h, 1.0, out=h)
+    np.sqrt(h, out=h)
+    np.arcsin(h, out=h)
+    np.multiply(h, _EARTH_DIAMETER_KM, out=out)
+    return out
+
+
+if njit is not None:
+    _haversine_impl = njit(parallel=True, fastmath=True, cache=True)(_haversine_loop)
+else:  # pragma: no cover - exercised when numba is not installed
+    _haversine_impl = _haversine_numpy
+
+
+def haversine_batch(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute great circle distances between corresponding points.
+    
+    Args:
+        lat1: Latitudes of the first points in degrees, float64 of shape (N,)
+        lon1: Longitudes of the first points in degrees, float64 of shape (N,)
+        lat2: Latitudes of the second points in degrees, float64 of shape (N,)
+        lon2: Longitudes of the second points in degrees, float64 of shape (N,)
+        out: float64 array of shape (N,) that receives the distances
+        
+    Returns:
+        np.ndarray: ``out``, holding distances in kilometers
+        
+    Raises:
+        ValueError: If the arrays are not all 1-D with the same length
+    """
+    # The compiled loop has no bounds checks, so mismatched lengths would read
+    # past the end of an array; the NumPy fallback would broadcast silently
+    n = lat1.shape[0] if lat1.ndim == 1 else -1
+    if any(a.ndim != 1 or a.shape[0] != n for a in (lat1, lon1, lat2, lon2, out)):
+        raise ValueError("haversine_batch: all arrays must be 1-D with the same length")
+    return _haversine_impl(lat1, lon1, lat2, lon2, out)
+
+
+def _decode_polyline_loop(buf, factor):
+    n = len(buf)
+    # Every encoded value takes at least one byte, so this bounds the point count
+    out = np.empty((n // 2, 2), dtype=np.float64)
+    lat = 0
+    lon = 0
+    i = 0
+    count = 0
+    while i < n:
+        for axis in range(2):
+            result = 0
+            shift = 0
+            while True:
+                if i >= n:
+                    raise ValueError("Truncated polyline")
+                b = buf[i] - 63
+                i += 1
+                result |= (b & 0x1F) << shift
+                shift += 5
+                if b < 0x20:
+                    break
+            delta = ~(result >> 1) if result & 1 else result >> 1
+            if axis == 0:
+                lat += delta
+            else:
+                lon += delta
+        out[count, 0] = lat / factor
+        out[count, 1] = lon / factor
+        count += 1
+    return out[:count]
+
+
+if njit is not None:
+    _decode_polyline_impl = njit(cache=True)(_decode_polyline_loop)
+else:  # pragma: no cover - exercised when numba is not installed
+    _decode_polyline_impl = _decode_polyline_loop
+
+
+def decode_polyline(encoded: str, precision: int = 5) -> np.ndarray:
+    """
+    Decode a Google encoded polyline straight into an array.
+    
+    Args:
+        encoded: Encoded polyline string
+        precision: Number of decimal places encoded (5 for OSRM's polyline)
+        
+    Returns:
+        np.ndarray: float64 array of shape (N, 2) with (latitude, longitude) rows
+        
+    Raises:
+        ValueError: If the polyline is truncated
+    """
+    buf = encoded.encode("ascii")
+    if njit is not None:
+        buf = np.frombuffer(buf, dtype=np.uint8)
+    return _decode_polyline_impl(buf, 10.0 ** precision)
@@ -6,6 +6,20 @@ from pathlib import Path
 
 from .config import load_config
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+_DEBUG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(filename)s:%(lineno)d - %(message)s"
+)
+_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
 
 def setup_logging(log_level: str, enable_debug: bool = False) -> None:
     """
@@ -15,19 +29,9 @@ def setup_logging(log_level: str, enable_debug: bool = False) -> None:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         enable_debug: Whether to enable debug mode with detailed formatting
     """
-    level = getattr(logging, log_level.upper())
-    
-    if enable_debug:
-        format_string = (
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(filename)s:%(lineno)d - %(message)s"
-        )
-    else:
-        format_string = "%(asctime)s - %(levelname)s - %(message)s"
-    
     logging.basicConfig(
-        level=level,
-        format=format_string,
+        level=_LEVELS[log_level.upper()],
+        format=_DEBUG_FORMAT if enable_debug else _FORMAT,
         handlers=[logging.StreamHandler(sys.stdout)]
     )
 
@@ -69,6 +73,8 @@ def main() -> int:
         logger.info(f"OSRM URL: {config.osrm_url}")
         logger.info(f"Output path: {config.output_path}")
         
+        config.ensure_output_dir()
+        
         # TODO: Implement main application logic
         # 1. Geocode addresses to coordinates
         # 2. Query OSRM for route alternatives
@@ -79,8 +85,8 @@ def main() -> int:
         return 0
         
     except Exception as e:
-        # Set up basic logging for error reporting
-        logging.basicConfig(level=logging.ERROR)
+        # If configuration failed before setup_logging ran, logging's
+        # last-resort handler still writes errors to stderr
         logger = logging.getLogger(__name__)
         
         logger.error(f"Application failed to start: {e}")
@@ -1,45 +1,56 @@
 """Coordinates model for geographical locations."""
 import math
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
 
+# Mean Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0
 
-class Coordinates(BaseModel):
+_EARTH_DIAMETER_KM = 2.0 * EARTH_RADIUS_KM
+_RADIANS_PER_DEGREE = math.pi / 180.0
+
+
+@dataclass(slots=True, frozen=True)
+class Coordinates:
     """
     Represents geographical coordinates with latitude and longitude.
     
     Provides validation for coordinate ranges and distance calculations.
+    Instances are immutable and hashable.
+    
+    Attributes:
+        latitude: Latitude in decimal degrees (-90 to 90)
+        longitude: Longitude in decimal degrees (-180 to 180)
     """
     
-    latitude: float = Field(
-        ...,
-        ge=-90.0,
-        le=90.0,
-        description="Latitude in decimal degrees (-90 to 90)"
-    )
-    longitude: float = Field(
-        ...,
-        ge=-180.0,
-        le=180.0,
-        description="Longitude in decimal degrees (-180 to 180)"
-    )
+    latitude: float
+    longitude: float
     
-    @field_validator('latitude')
-    @classmethod
-    def validate_latitude(cls, v: float) -> float:
-        """Validate latitude is within valid range."""
-        if not -90.0 <= v <= 90.0:
+    def __post_init__(self) -> None:
+        """Validate latitude and longitude are within valid ranges."""
+        if not -90.0 <= self.latitude <= 90.0:
             raise ValueError("Latitude must be between -90 and 90 degrees")
-        return v
+        if not -180.0 <= self.longitude <= 180.0:
+            raise ValueError("Longitude must be between -180 and 180 degrees")
     
-    @field_validator('longitude')
     @classmethod
-    def validate_longitude(cls, v: float) -> float:
-        """Validate longitude is within valid range."""
-        if not -180.0 <= v <= 180.0:
-            raise ValueError("Longitude must be between -180 and 180 degrees")
-        return v
+    def model_validate(cls, obj: Any) -> 'Coordinates':
+        """
+        Create Coordinates from a mapping with latitude/longitude keys.
+        
+        Kept for call sites written against the former Pydantic model.
+        
+        Args:
+            obj: Coordinates instance or mapping of field values
+            
+        Returns:
+            Coordinates: Validated coordinates instance
+        """
+        if isinstance(obj, cls):
+            return obj
+        return cls(latitude=obj["latitude"], longitude=obj["longitude"])
     
     @classmethod
     def from_tuple(cls, coord_tuple: Tuple[float, float]) -> 'Coordinates':
@@ -54,6 +65,46 @@ class Coordinates(BaseModel):
         """
         return cls(latitude=coord_tuple[0], longitude=coord_tuple[1])
     
+    @classmethod
+    def build_trusted(cls, latitude: float, longitude: float) -> 'Coordinates':
+        """
+        Create Coordinates from a trusted (latitude, longitude) pair.
+        
+        Skips field validation (checked only by an assert, so not under -O);
+        use it only when the ranges are already guaranteed.
+        
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            
+        Returns:
+            Coordinates: New coordinates instance
+        """
+        assert -90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0
+        c = object.__new__(cls)
+        object.__setattr__(c, "latitude", latitude)
+        object.__setattr__(c, "longitude", longitude)
+        return c
+    
+    @classmethod
+    def model_construct_batch(
+        cls, points: Iterable[Tuple[float, float]]
+    ) -> List['Coordinates']:
+        """
+        Create many Coordinates from trusted (latitude, longitude) pairs.
+        
+        Skips field validation, so only use this for points whose ranges are
+        already guaranteed, such as those decoded from an OSRM polyline.
+        
+        Args:
+            points: Iterable of (latitude, longitude) pairs
+            
+        Returns:
+            List[Coordinates]: New coordinates instances
+        """
+        build = cls.build_trusted
+        return [build(lat, lon) for lat, lon in points]
+    
     def to_tuple(self) -> Tuple[float, float]:
         """
         Convert coordinates to a tuple of (latitude, longitude).
@@ -76,27 +127,76 @@ class Coordinates(BaseModel):
         Returns:
             float: Distance in kilometers
         """
-        if self == other:
+        if self is other:
             return 0.0
         
-        # Convert latitude and longitude from degrees to radians
-        lat1_rad = math.radians(self.latitude)
-        lon1_rad = math.radians(self.longitude)
-        lat2_rad = math.radians(other.latitude)
-        lon2_rad = math.radians(other.longitude)
+        # Haversine formula; radians are derived per call rather than stored,
+        # keeping instances at two fields
+        lat1_rad = self.latitude * _RADIANS_PER_DEGREE
+        lat2_rad = other.latitude * _RADIANS_PER_DEGREE
+        half_dlat = (lat2_rad - lat1_rad) * 0.5
+        half_dlon = (other.longitude - self.longitude) * (0.5 * _RADIANS_PER_DEGREE)
         
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
+        sin_dlat = math.sin(half_dlat)
+        sin_dlon = math.sin(half_dlon)
+        a = sin_dlat * sin_dlat + math.cos(lat1_rad) * math.cos(lat2_rad) * sin_dlon * sin_dlon
         
-        a = (math.sin(dlat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
-        c = 2 * math.asin(math.sqrt(a))
+        # Rounding can push a just above 1 for near-antipodal points
+        return _EARTH_DIAMETER_KM * math.asin(math.sqrt(min(a, 1.0)))
+    
+    @staticmethod
+    def haversine_array(
+        lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate great circle distances between corresponding points.
         
-        # Earth's radius in kilometers
-        earth_radius_km = 6371.0
+        Vectorized counterpart of `distance_to` for batches of points, e.g. a
+        decoded route geometry. Prefer `distance_to` for a single pair, where
+        NumPy's fixed per-call overhead outweighs the gain.
         
-        return earth_radius_km * c
+        Args:
+            lat1: Latitudes of the first points in degrees, shape (N,)
+            lon1: Longitudes of the first points in degrees, shape (N,)
+            lat2: Latitudes of the second points in degrees, shape (N,)
+            lon2: Longitudes of the second points in degrees, shape (N,)
+            
+        Returns:
+            np.ndarray: Array of shape (N,) with distances in kilometers
+            
+        Raises:
+            ValueError: If the inputs are not 1-D arrays of the same length
+        """
+        # Imported here so only batch callers pay for loading (and JIT-compiling)
+        # numba; importing the model stays cheap
+        from ..geo._kernels import haversine_batch
+        
+        # Contiguous float64 columns let the compiled kernel stream through memory
+        lat1, lon1, lat2, lon2 = (
+            np.ascontiguousarray(a, dtype=np.float64) for a in (lat1, lon1, lat2, lon2)
+        )
+        return haversine_batch(lat1, lon1, lat2, lon2, np.empty(len(lat1), dtype=np.float64))
+    
+    @classmethod
+    def pairwise_distances(cls, arr_a: np.ndarray, arr_b: np.ndarray) -> np.ndarray:
+        """
+        Calculate great circle distances between corresponding rows of two arrays.
+        
+        Args:
+            arr_a: Array of shape (N, 2) holding (latitude, longitude) rows
+            arr_b: Array of shape (N, 2) holding (latitude, longitude) rows
+            
+        Returns:
+            np.ndarray: Array of shape (N,) with distances in kilometers
+            
+        Raises:
+            ValueError: If the arrays do not both have shape (N, 2)
+        """
+        a = np.asarray(arr_a, dtype=np.float64)
+        b = np.asarray(arr_b, dtype=np.float64)
+        if a.ndim != 2 or a.shape[1] != 2 or a.shape != b.shape:
+            raise ValueError("pairwise_distances: arrays must both have shape (N, 2)")
+        return cls.haversine_array(a[:, 0], a[:, 1], b[:, 0], b[:, 1])
     
     def __str__(self) -> str:
         """String representation of coordinates."""
@@ -105,14 +205,3 @@ class Coordinates(BaseModel):
     def __repr__(self) -> str:
         """Detailed string representation of coordinates."""
         return f"Coordinates(latitude={self.latitude}, longitude={self.longitude})"
-    
-    def __hash__(self) -> int:
-        """Make coordinates hashable for use in sets and as dict keys."""
-        return hash((self.latitude, self.longitude))
-    
-    def __eq__(self, other) -> bool:
-        """Check equality with another Coordinates object."""
-        if not isinstance(other, Coordinates):
-            return False
-        return (self.latitude == other.latitude and 
-                self.longitude == other.longitude)
\ No newline at end of file
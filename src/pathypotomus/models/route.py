@@ -1,68 +1,321 @@
 """Route model for representing navigation routes."""
-from typing import List, Optional
+import hashlib
+from dataclasses import MISSING, dataclass, field, fields
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union, overload
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
 
 from .coordinates import Coordinates
 
 
-class Route(BaseModel):
+class RouteGeometry(Sequence[Coordinates]):
+    """
+    Read-only sequence of route coordinates backed by an (N, 2) float64 array.
+    
+    Coordinates are created on access, so a long route costs one array rather
+    than one Python object per point. The array is range-checked when the
+    route is built, so every access path skips per-point validation. It is
+    column-major, so `lats` and `lons` are contiguous views that bulk
+    operations can use directly.
+    """
+    
+    __slots__ = ("array",)
+    
+    def __init__(self, array: np.ndarray) -> None:
+        self.array = array
+    
+    @property
+    def lats(self) -> np.ndarray:
+        """Get the latitudes as a contiguous read-only (N,) view."""
+        return self.array[:, 0]
+    
+    @property
+    def lons(self) -> np.ndarray:
+        """Get the longitudes as a contiguous read-only (N,) view."""
+        return self.array[:, 1]
+    
+    def __len__(self) -> int:
+        return len(self.array)
+    
+    @overload
+    def __getitem__(self, index: int) -> Coordinates: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[Coordinates]: ...
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Coordinates, List[Coordinates]]:
+        if isinstance(index, slice):
+            return Coordinates.model_construct_batch(self.array[index].tolist())
+        lat, lon = self.array[index].tolist()
+        return Coordinates.build_trusted(lat, lon)
+    
+    def __iter__(self) -> Iterator[Coordinates]:
+        return iter(Coordinates.model_construct_batch(self.array.tolist()))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RouteGeometry):
+            return np.array_equal(self.array, other.array)
+        if isinstance(other, Sequence):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        return f"RouteGeometry(points={len(self.array)})"
+
+
+_LAT_LON = attrgetter("latitude", "longitude")
+
+
+def _format_distance(meters: float) -> str:
+    """Format a distance in meters as kilometers from 1000m, else whole meters."""
+    if meters >= 1000.0:
+        return f"{meters / 1000.0:.1f} km"
+    return f"{int(round(meters))} m"
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration in seconds as hours and minutes, minutes, or seconds."""
+    total_seconds = int(round(seconds))
+    if total_seconds >= 3600:  # 1 hour or more
+        hours, remainder = divmod(total_seconds, 3600)
+        return f"{hours}h {remainder // 60}m"
+    if total_seconds >= 60:  # 1 minute or more
+        return f"{total_seconds // 60}m"
+    return f"{total_seconds}s"
+
+
+def _to_geometry_array(v: Any) -> np.ndarray:
+    """
+    Convert geometry to a read-only, column-major (N, 2) float64 array with at
+    least 2 points.
+    
+    Accepts a RouteGeometry, a sequence of Coordinates, a sequence of
+    (latitude, longitude) pairs, or an array of shape (N, 2).
+    
+    Raises:
+        ValueError: If the geometry is malformed, has fewer than 2 points or
+            has a point out of range
+    """
+    if isinstance(v, RouteGeometry):
+        # Already validated and read-only, so it can be shared
+        return v.array
+    arr = None
+    trusted = False
+    if isinstance(v, (list, tuple)) and v and type(v[0]) is Coordinates:
+        # Fast path: stream the fields of already-validated points straight
+        # into the array, without building an intermediate tuple per point
+        try:
+            arr = np.fromiter(
+                chain.from_iterable(map(_LAT_LON, v)), dtype=np.float64, count=2 * len(v)
+            ).reshape(-1, 2)
+            trusted = True
+        except AttributeError:
+            arr = None  # Mixed input; take the general path
+    if arr is None:
+        if not isinstance(v, np.ndarray):
+            v = [p.to_tuple() if isinstance(p, Coordinates) else p for p in v]
+        arr = np.array(v, dtype=np.float64)
+    if arr.size == 0:
+        arr = arr.reshape(0, 2)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError("geometry: Route geometry must be a sequence of (latitude, longitude) points")
+    if len(arr) < 2:
+        raise ValueError("geometry: Route geometry must contain at least 2 coordinate points")
+    if not trusted:
+        # Raw pairs and arrays have not been through Coordinates validation;
+        # written as negated ranges so NaN is rejected too
+        lats, lons = arr[:, 0], arr[:, 1]
+        if not ((lats >= -90.0) & (lats <= 90.0)).all():
+            raise ValueError("geometry: Latitude must be between -90 and 90 degrees")
+        if not ((lons >= -180.0) & (lons <= 180.0)).all():
+            raise ValueError("geometry: Longitude must be between -180 and 180 degrees")
+    # Column-major keeps each coordinate axis contiguous for vectorized kernels
+    arr = np.asfortranarray(arr)
+    # Read-only so the cached geometry digest cannot go stale
+    arr.flags.writeable = False
+    return arr
+
+
+class _RouteCaches:
+    """
+    Slots for values derived from a Route's fields.
+    
+    Declared outside the dataclass so they stay out of fields(), asdict() and
+    astuple().
+    """
+    
+    __slots__ = ("_geom_hash", "_distance_formatted", "_duration_formatted")
+    
+    def _init_caches(self) -> None:
+        # Formatted once, since routes are immutable and rendered repeatedly;
+        # the geometry digest is computed on first use
+        object.__setattr__(self, "_geom_hash", None)
+        object.__setattr__(self, "_distance_formatted", _format_distance(self.distance))
+        object.__setattr__(self, "_duration_formatted", _format_duration(self.duration))
+
+
+@dataclass(frozen=True, slots=True)
+class Route(_RouteCaches):
     """
     Represents a navigation route with geometry, distance, duration, and metadata.
     
     Contains the route path as a series of coordinates, along with computed
-    metrics and optional AI-generated descriptions.
+    metrics and optional AI-generated descriptions. Instances are immutable.
+    
+    Attributes:
+        geometry: Coordinates defining the route path; accepts a sequence of
+            Coordinates, (latitude, longitude) pairs or an (N, 2) array
+        distance: Route distance in meters
+        duration: Estimated travel time in seconds
+        summary: Brief route summary (e.g., 'via Highway 1')
+        major_roads: List of major roads used in this route
+        name: AI-generated route name
+        description: AI-generated route description
     """
     
-    geometry: List[Coordinates] = Field(
-        ...,
-        min_length=2,
-        description="List of coordinates defining the route path"
-    )
-    distance: float = Field(
-        ...,
-        ge=0.0,
-        description="Route distance in meters"
-    )
-    duration: float = Field(
-        ...,
-        ge=0.0,
-        description="Estimated travel time in seconds"
-    )
-    summary: str = Field(
-        default="",
-        description="Brief route summary (e.g., 'via Highway 1')"
-    )
-    major_roads: List[str] = Field(
-        default_factory=list,
-        description="List of major roads used in this route"
-    )
-    name: Optional[str] = Field(
-        default=None,
-        description="AI-generated route name"
-    )
-    description: Optional[str] = Field(
-        default=None,
-        description="AI-generated route description"
-    )
-    
-    @field_validator('geometry')
+    geometry: RouteGeometry
+    distance: float
+    duration: float
+    summary: str = ""
+    major_roads: List[str] = field(default_factory=list)
+    name: Optional[str] = None
+    description: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        """
+        Normalise geometry and validate metrics.
+        
+        Raises:
+            ValueError: If a field is invalid; the message starts with its name
+        """
+        object.__setattr__(self, "geometry", RouteGeometry(_to_geometry_array(self.geometry)))
+        if not self.distance >= 0.0:
+            raise ValueError("distance: Route distance cannot be negative")
+        if not self.duration >= 0.0:
+            raise ValueError("duration: Route duration cannot be negative")
+        self._init_caches()
+    
     @classmethod
-    def validate_geometry(cls, v: List[Coordinates]) -> List[Coordinates]:
-        """Validate that geometry has at least 2 points."""
-        if len(v) < 2:
-            raise ValueError("Route geometry must contain at least 2 coordinate points")
-        return v
+    def build_trusted(
+        cls,
+        geometry: np.ndarray,
+        distance: float,
+        duration: float,
+        summary: str = "",
+        major_roads: Optional[List[str]] = None,
+    ) -> 'Route':
+        """
+        Create a Route from trusted data, skipping validation.
+        
+        Meant for routes built from decoded OSRM responses, whose geometry and
+        metrics are well formed by construction. Invariants are checked only
+        by asserts, so not under -O. The route takes ownership of
+        ``geometry`` and marks it read-only.
+        
+        Args:
+            geometry: (N, 2) float64 array of (latitude, longitude) rows, N >= 2
+            distance: Route distance in meters
+            duration: Estimated travel time in seconds
+            summary: Brief route summary
+            major_roads: List of major roads used in this route
+            
+        Returns:
+            Route: New route instance
+        """
+        assert geometry.ndim == 2 and geometry.shape[1] == 2 and len(geometry) >= 2
+        assert distance >= 0.0 and duration >= 0.0
+        arr = np.asfortranarray(geometry, dtype=np.float64)
+        arr.flags.writeable = False
+        values = {
+            "geometry": RouteGeometry(arr),
+            "distance": distance,
+            "duration": duration,
+            "summary": summary,
+        }
+        if major_roads is not None:
+            values["major_roads"] = major_roads
+        
+        route = object.__new__(cls)
+        # Every other field takes its declared default, so new fields need no
+        # changes here
+        for f in fields(cls):
+            if f.name in values:
+                value = values[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            else:
+                value = f.default_factory()
+            object.__setattr__(route, f.name, value)
+        route._init_caches()
+        return route
+    
+    def __reduce__(self):
+        # The caches are not fields, so the dataclass pickle state would drop
+        # them; rebuild through __init__, which recomputes them
+        args = tuple(getattr(self, f.name) for f in fields(self))
+        return (type(self), (self.geometry.array,) + args[1:])
+    
+    @property
+    def geometry_arr(self) -> np.ndarray:
+        """Get the route path as a read-only (N, 2) array of (latitude, longitude) rows."""
+        return self.geometry.array
+    
+    @property
+    def lats(self) -> np.ndarray:
+        """Get the route latitudes as a contiguous read-only (N,) array."""
+        return self.geometry.array[:, 0]
+    
+    @property
+    def lons(self) -> np.ndarray:
+        """Get the route longitudes as a contiguous read-only (N,) array."""
+        return self.geometry.array[:, 1]
+    
+    def path_length_km(self) -> float:
+        """
+        Calculate the great circle length of the route path.
+        
+        Sums the haversine distance between consecutive geometry points, so
+        it measures the drawn path rather than the road distance OSRM reports.
+        
+        Returns:
+            float: Path length in kilometers
+        """
+        lats, lons = self.lats, self.lons
+        return float(Coordinates.haversine_array(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum())
+    
+    def bounding_box(self) -> Tuple[Coordinates, Coordinates]:
+        """
+        Get the smallest box enclosing the route path.
+        
+        Returns:
+            Tuple[Coordinates, Coordinates]: South-west and north-east corners
+        """
+        lats, lons = self.lats, self.lons
+        return (
+            Coordinates.build_trusted(float(lats.min()), float(lons.min())),
+            Coordinates.build_trusted(float(lats.max()), float(lons.max())),
+        )
+    
+    def _geometry_digest(self) -> bytes:
+        """128-bit digest of the geometry array, computed once per route."""
+        if self._geom_hash is None:
+            digest = hashlib.blake2b(self.geometry.array.tobytes(), digest_size=16).digest()
+            object.__setattr__(self, "_geom_hash", digest)
+        return self._geom_hash
     
     @property
     def start_point(self) -> Coordinates:
         """Get the starting point of the route."""
-        return self.geometry[0]
+        return Coordinates.build_trusted(float(self.lats[0]), float(self.lons[0]))
     
     @property
     def end_point(self) -> Coordinates:
         """Get the ending point of the route."""
-        return self.geometry[-1]
+        return Coordinates.build_trusted(float(self.lats[-1]), float(self.lons[-1]))
     
     @property
     def distance_formatted(self) -> str:
@@ -74,11 +327,7 @@ class Route(BaseModel):
         Returns:
             str: Formatted distance (e.g., "5.2 km" or "850 m")
         """
-        if self.distance >= 1000.0:
-            km = self.distance / 1000.0
-            return f"{km:.1f} km"
-        else:
-            return f"{int(round(self.distance))} m"
+        return self._distance_formatted
     
     @property
     def duration_formatted(self) -> str:
@@ -91,17 +340,7 @@ class Route(BaseModel):
         Returns:
             str: Formatted duration (e.g., "1h 25m", "15m", or "45s")
         """
-        total_seconds = int(round(self.duration))
-        
-        if total_seconds >= 3600:  # 1 hour or more
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
-        elif total_seconds >= 60:  # 1 minute or more
-            minutes = total_seconds // 60
-            return f"{minutes}m"
-        else:  # Less than 1 minute
-            return f"{total_seconds}s"
+        return self._duration_formatted
     
     def __str__(self) -> str:
         """String representation of the route."""
@@ -127,9 +366,13 @@ class Route(BaseModel):
         if not isinstance(other, Route):
             return False
         return (
-            self.geometry == other.geometry and
             self.distance == other.distance and
             self.duration == other.duration and
+            self._geometry_digest() == other._geometry_digest() and
             self.summary == other.summary and
             self.major_roads == other.major_roads
-        )
\ No newline at end of file
+        )
+    
+    def __hash__(self) -> int:
+        """Make routes hashable so alternatives can be deduplicated in sets."""
+        return hash((self._geometry_digest(), self.distance, self.duration, self.summary))
\ No newline at end of file
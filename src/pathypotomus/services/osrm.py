@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
-import polyline
+import numpy as np
 
 from pathypotomus.models.coordinates import Coordinates
 from pathypotomus.models.route import Route
@@ -13,6 +15,20 @@ try:
 except Exception:  # pragma: no cover - aiohttp not required for unit tests
     aiohttp = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional C-accelerated JSON parser
+    orjson = None  # type: ignore
+
+try:
+    from pypolyline.cutil import decode_polyline as _fast_decode_polyline  # type: ignore
+except Exception:  # pragma: no cover - optional C-accelerated decoder
+    _fast_decode_polyline = None  # type: ignore
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_MAX_MAJOR_ROADS = 5
+
 
 class RoutingError(Exception):
     """Raised when routing operations fail"""
@@ -25,12 +41,22 @@ class _HttpClient:
     session: any
 
     async def get_json(self, url: str, params: dict) -> tuple[int, dict]:
+        """Fetch ``url`` and parse the body; non-200 bodies are not parsed."""
         async with self.session.get(url, params=params) as response:
-            return response.status, await response.json()
+            # Parse the raw bytes directly, skipping aiohttp's decode to str
+            raw = await response.read()
+            if response.status != 200:
+                return response.status, {}
+            return response.status, _json_loads(raw)
 
 
 class OSRMService:
-    """OSRM routing service client."""
+    """OSRM routing service client.
+
+    When no session is injected, the service lazily creates one pooled
+    aiohttp session and reuses it across calls. Use the service as an async
+    context manager, or call ``aclose()``, to release it.
+    """
 
     def __init__(
         self,
@@ -39,6 +65,30 @@ class OSRMService:
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.session = session
+        self._session: Optional[any] = None
+
+    async def __aenter__(self) -> "OSRMService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the session owned by this service, if one was created."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _ensure_session(self) -> any:
+        if self.session is not None:
+            return self.session
+        if aiohttp is None:
+            raise RoutingError("aiohttp is required for network calls but is not available")
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
 
     async def get_routes(
         self,
@@ -46,26 +96,25 @@ class OSRMService:
         destination: Coordinates,
         alternatives: bool = True,
         max_alternatives: int = 3,
+        include_steps: bool = True,
     ) -> List[Route]:
-        """Get route alternatives from OSRM and parse into Route models."""
+        """Get route alternatives from OSRM and parse into Route models.
+
+        Major roads and the summary are derived from turn-by-turn steps. Pass
+        ``include_steps=False`` when only the geometry and totals are needed;
+        OSRM then omits the steps, which shrinks the response considerably,
+        and the routes come back with empty ``major_roads`` and ``summary``.
+        """
         url = self._build_route_url(origin, destination)
         params = {
             "alternatives": "true" if alternatives else "false",
             "overview": "simplified",
-            "steps": "true",
             "geometries": "polyline",
         }
+        if include_steps:
+            params["steps"] = "true"
 
-        # Choose or create a session
-        client: _HttpClient
-        if self.session is not None:
-            client = _HttpClient(self.session)
-        else:
-            if aiohttp is None:
-                raise RoutingError("aiohttp is required for network calls but is not available")
-            session = aiohttp.ClientSession()
-            client = _HttpClient(session)  # pragma: no cover - not used in unit tests
-
+        client = _HttpClient(await self._ensure_session())
         status, data = await client.get_json(url, params=params)
         if status != 200:
             raise RoutingError(f"OSRM request failed: HTTP {status}")
@@ -76,37 +125,95 @@ class OSRMService:
         osrm_routes = data.get("routes", [])[:max_alternatives]
         parsed: List[Route] = []
         for idx, osrm_route in enumerate(osrm_routes):
-            parsed.append(self._parse_osrm_route(osrm_route))
+            parsed.append(self._parse_osrm_route(osrm_route, include_steps=include_steps))
         return parsed
 
+    async def get_routes_batch(
+        self,
+        pairs: Sequence[Tuple[Coordinates, Coordinates]],
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> List[Union[List[Route], Exception]]:
+        """Get routes for several origin/destination pairs concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once so the OSRM
+        server is not flooded. Results are returned in the order of ``pairs``;
+        a pair that fails yields its exception (usually ``RoutingError``)
+        instead of aborting the whole batch. Extra keyword arguments are
+        passed through to ``get_routes``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(origin: Coordinates, destination: Coordinates) -> List[Route]:
+            async with semaphore:
+                return await self.get_routes(origin, destination, **kwargs)
+
+        return await asyncio.gather(
+            *(_one(origin, destination) for origin, destination in pairs),
+            return_exceptions=True,
+        )
+
     def _build_route_url(self, origin: Coordinates, destination: Coordinates) -> str:
         coords = f"{origin.longitude},{origin.latitude};{destination.longitude},{destination.latitude}"
         return f"{self.base_url}/route/v1/driving/{coords}"
 
-    def _parse_osrm_route(self, osrm_route: dict) -> Route:
-        geometry = self._decode_polyline(osrm_route["geometry"])
-        major_roads = self._extract_major_roads(osrm_route.get("legs", []))
-        summary = self._generate_summary(major_roads)
-        return Route(
-            geometry=geometry,
-            distance=float(osrm_route["distance"]),
-            duration=float(osrm_route["duration"]),
+    def _parse_osrm_route(self, osrm_route: dict, include_steps: bool = True) -> Route:
+        try:
+            geometry = self._decode_polyline(osrm_route["geometry"])
+        except (ValueError, RuntimeError) as exc:
+            # pypolyline raises RuntimeError, the built-in decoder ValueError
+            raise RoutingError(f"OSRM returned an invalid route geometry: {exc}") from exc
+        if len(geometry) < 2:
+            raise RoutingError("OSRM returned a route geometry with fewer than 2 points")
+        if include_steps and "legs" in osrm_route:
+            major_roads = self._extract_major_roads(osrm_route["legs"])
+            summary = self._generate_summary(major_roads)
+        else:
+            major_roads = []
+            summary = ""
+        # Decoded geometry and OSRM metrics are well formed, so skip validation
+        return Route.build_trusted(
+            geometry,
+            float(osrm_route["distance"]),
+            float(osrm_route["duration"]),
             summary=summary,
             major_roads=major_roads,
         )
 
-    def _decode_polyline(self, encoded: str) -> List[Coordinates]:
-        points = polyline.decode(encoded)
-        return [Coordinates(latitude=lat, longitude=lon) for lat, lon in points]
+    def _decode_polyline(self, encoded: str) -> np.ndarray:
+        """Decode a polyline into an (N, 2) array of (latitude, longitude) rows.
+
+        No Coordinates are built here, so no per-point validation runs. The
+        polyline format itself can encode any value; this relies on OSRM only
+        emitting valid coordinates. Route.build_trusted checks the array's
+        shape with asserts only, so nothing is checked under ``python -O``;
+        _parse_osrm_route rejects short geometries itself.
+
+        Raises:
+            ValueError: If the built-in decoder meets a malformed polyline
+            RuntimeError: If pypolyline meets a malformed polyline
+        """
+        if _fast_decode_polyline is not None:
+            # pypolyline yields [longitude, latitude] pairs (GeoJSON order)
+            points = _fast_decode_polyline(encoded.encode("ascii"), 5)
+            return np.array(points, dtype=np.float64).reshape(-1, 2)[:, ::-1]
+        # Imported here so importing the service does not load numba when
+        # pypolyline handles decoding
+        from pathypotomus.geo._kernels import decode_polyline
+
+        return decode_polyline(encoded, 5)
 
     def _extract_major_roads(self, legs: List[dict]) -> List[str]:
-        roads: list[str] = []
+        # A dict keeps first-seen order while deduplicating in O(1) per name
+        roads: dict[str, None] = {}
         for leg in legs:
-            for step in leg.get("steps", []):
+            for step in leg.get("steps", ()):
                 name = (step.get("name") or "").strip()
-                if name and len(name) > 1 and name not in roads:
-                    roads.append(name)
-        return roads[:5]
+                if len(name) > 1:
+                    roads[name] = None
+                    if len(roads) == _MAX_MAJOR_ROADS:
+                        return list(roads)
+        return list(roads)
 
     def _generate_summary(self, major_roads: List[str]) -> str:
         if not major_roads:
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+import pytest
+
+from pathypotomus.models.coordinates import Coordinates
+
+pytest_plugins = ["tests.fixtures.routes"]
+
+
+@pytest.fixture(scope="session")
+def origin_coords(chicago_coordinates) -> Coordinates:
+    """Route origin used by the service tests."""
+    return chicago_coordinates
+
+
+@pytest.fixture(scope="session")
+def dest_coords(milwaukee_coordinates) -> Coordinates:
+    """Route destination used by the service tests."""
+    return milwaukee_coordinates
@@ -1,34 +1,43 @@
-"""Test fixtures for route data."""
+"""
+Test fixtures for route data.
+
+Coordinates are immutable, so their fixtures are session-scoped and built
+once for the whole run, with containers returned as tuples or read-only
+mappings. A Route's major_roads is a mutable list, so Route fixtures are
+module-scoped to keep any mutation from leaking beyond one test module.
+"""
+from types import MappingProxyType
+
 import pytest
 from pathypotomus.models.coordinates import Coordinates
 from pathypotomus.models.route import Route
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chicago_coordinates():
     """Chicago downtown coordinates."""
     return Coordinates(latitude=41.8781, longitude=-87.6298)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def milwaukee_coordinates():
     """Milwaukee downtown coordinates."""
     return Coordinates(latitude=43.0389, longitude=-87.9065)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_route_geometry():
     """Sample route geometry with multiple points."""
-    return [
+    return (
         Coordinates(latitude=41.8781, longitude=-87.6298),  # Chicago
         Coordinates(latitude=41.8800, longitude=-87.6300),
         Coordinates(latitude=41.8850, longitude=-87.6350),
         Coordinates(latitude=42.0000, longitude=-87.7000),
         Coordinates(latitude=43.0389, longitude=-87.9065),  # Milwaukee
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_route(sample_route_geometry):
     """Sample route with basic data."""
     return Route(
@@ -40,7 +49,7 @@ def sample_route(sample_route_geometry):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_route_with_ai_content(sample_route_geometry):
     """Sample route with AI-generated content."""
     return Route(
@@ -54,7 +63,7 @@ def sample_route_with_ai_content(sample_route_geometry):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def short_route():
     """Short route for testing formatting."""
     return Route(
@@ -68,7 +77,7 @@ def short_route():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multiple_routes(sample_route, short_route):
     """Multiple routes for testing collections."""
     long_route = Route(
@@ -82,13 +91,13 @@ def multiple_routes(sample_route, short_route):
         major_roads=["I-90 East", "Mass Pike"]
     )
     
-    return [sample_route, short_route, long_route]
+    return (sample_route, short_route, long_route)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chicago_to_milwaukee_addresses():
     """Sample addresses for testing geocoding."""
-    return {
+    return MappingProxyType({
         'origin': '123 N Michigan Ave, Chicago, IL',
         'destination': '456 E Wisconsin Ave, Milwaukee, WI'
-    }
\ No newline at end of file
+    })
\ No newline at end of file
@@ -1,14 +1,21 @@
 """Tests for configuration management."""
 import os
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from pydantic import ValidationError
 
 from pathypotomus.config import Config, load_config
 
+_CONFIG_ENV_VARS = (
+    'ORIGIN_ADDR', 'DEST_ADDR', 'OSRM_URL', 'LLM_API_KEY', 'LLM_MODEL', 'LLM_PROVIDER',
+    'OUTPUT_PATH', 'OUTPUT_TITLE', 'LOG_LEVEL', 'ENABLE_DEBUG_MODE', 'MAX_ROUTES', 'REQUEST_TIMEOUT',
+)
+
+
+def _isolated(**values):
+    """Overrides that hide every config environment variable except ``values``."""
+    return {**dict.fromkeys(_CONFIG_ENV_VARS), **values}
+
 
 class TestConfig:
     """Test configuration model validation."""
@@ -37,49 +44,48 @@ class TestConfig:
 
     def test_missing_required_fields(self):
         """Test validation error for missing required fields."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(TypeError) as exc_info:
             Config()
         
-        errors = exc_info.value.errors()
-        error_fields = {error['loc'][0] for error in errors}
-        assert 'origin_addr' in error_fields
-        assert 'dest_addr' in error_fields
+        assert 'origin_addr' in str(exc_info.value)
+        assert 'dest_addr' in str(exc_info.value)
 
     def test_invalid_log_level(self):
         """Test validation error for invalid log level."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="log_level"):
             Config(
                 origin_addr="123 Main St",
                 dest_addr="456 Oak Ave",
                 log_level="INVALID"
             )
+
+    def test_log_level_is_case_insensitive(self):
+        """Test log level names are accepted in any case and normalised."""
+        config = Config(
+            origin_addr="123 Main St",
+            dest_addr="456 Oak Ave",
+            log_level="debug"
+        )
         
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'log_level' for error in errors)
+        assert config.log_level == "DEBUG"
 
     def test_invalid_max_routes(self):
         """Test validation error for invalid max_routes."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="max_routes"):
             Config(
                 origin_addr="123 Main St",
                 dest_addr="456 Oak Ave",
                 max_routes=0
             )
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'max_routes' for error in errors)
 
     def test_invalid_request_timeout(self):
         """Test validation error for invalid request_timeout."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="request_timeout"):
             Config(
                 origin_addr="123 Main St",
                 dest_addr="456 Oak Ave",
                 request_timeout=-1
             )
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'request_timeout' for error in errors)
 
     def test_default_values(self):
         """Test default values are applied correctly."""
@@ -97,6 +103,21 @@ class TestConfig:
         assert config.request_timeout == 30
         assert config.enable_debug_mode is False
 
+    def test_output_dir_created_only_on_request(self, tmp_path):
+        """Test that validation has no filesystem side effects."""
+        output_path = tmp_path / "nested" / "routes.html"
+        config = Config(
+            origin_addr="123 Main St",
+            dest_addr="456 Oak Ave",
+            output_path=str(output_path)
+        )
+        
+        assert not output_path.parent.exists()
+        
+        config.ensure_output_dir()
+        
+        assert output_path.parent.is_dir()
+
 
 class TestLoadConfig:
     """Test configuration loading from environment and files."""
@@ -114,8 +135,7 @@ class TestLoadConfig:
             'REQUEST_TIMEOUT': '60'
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = load_config()
+        config = load_config(env_file="nonexistent.env", overrides=env_vars)
         
         assert config.origin_addr == '123 Main St, Test City'
         assert config.dest_addr == '456 Oak Ave, Test City'
@@ -126,7 +146,7 @@ class TestLoadConfig:
         assert config.max_routes == 5
         assert config.request_timeout == 60
 
-    def test_load_from_env_file(self):
+    def test_load_from_env_file(self, tmp_path):
         """Test loading configuration from .env file."""
         env_content = """
 ORIGIN_ADDR="123 Main St, File City"
@@ -135,50 +155,55 @@ LLM_API_KEY="file-api-key"
 LOG_LEVEL="WARNING"
         """.strip()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-            f.write(env_content)
-            env_file_path = f.name
+        env_file_path = tmp_path / "test.env"
+        env_file_path.write_text(env_content)
         
-        try:
-            config = load_config(env_file=env_file_path)
-            
-            assert config.origin_addr == "123 Main St, File City"
-            assert config.dest_addr == "456 Oak Ave, File City"
-            assert config.llm_api_key == "file-api-key"
-            assert config.log_level == "WARNING"
-        finally:
-            os.unlink(env_file_path)
+        config = load_config(env_file=str(env_file_path), overrides=_isolated())
+        
+        assert config.origin_addr == "123 Main St, File City"
+        assert config.dest_addr == "456 Oak Ave, File City"
+        assert config.llm_api_key == "file-api-key"
+        assert config.log_level == "WARNING"
+
+    def test_env_file_syntax(self, tmp_path):
+        """Test comments, export prefixes and quoting in .env files."""
+        env_content = """
+# Comment line
+export ORIGIN_ADDR='123 Main St, File City'
+DEST_ADDR="456 Oak Ave # Unit 2" # trailing comment
+OUTPUT_TITLE=Unquoted Title # trailing comment
+ENABLE_DEBUG_MODE=true
+        """.strip()
+        
+        env_file_path = tmp_path / "test.env"
+        env_file_path.write_text(env_content)
+        
+        config = load_config(env_file=str(env_file_path), overrides=_isolated())
+        
+        assert config.origin_addr == "123 Main St, File City"
+        assert config.dest_addr == "456 Oak Ave # Unit 2"
+        assert config.output_title == "Unquoted Title"
+        assert config.enable_debug_mode is True
 
     def test_missing_required_config_raises_error(self):
         """Test that missing required configuration raises clear error."""
-        # Clear environment variables that might be set
-        env_vars_to_clear = ['ORIGIN_ADDR', 'DEST_ADDR']
+        with pytest.raises(ValueError) as exc_info:
+            load_config(env_file="nonexistent.env", overrides=_isolated())
         
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValidationError) as exc_info:
-                load_config()
-            
-            errors = exc_info.value.errors()
-            error_fields = {error['loc'][0] for error in errors}
-            assert 'origin_addr' in error_fields
-            assert 'dest_addr' in error_fields
+        assert 'ORIGIN_ADDR' in str(exc_info.value)
+        assert 'DEST_ADDR' in str(exc_info.value)
 
     def test_env_file_not_found_uses_defaults(self):
         """Test that non-existent env file doesn't cause errors."""
-        env_vars = {
-            'ORIGIN_ADDR': '123 Main St',
-            'DEST_ADDR': '456 Oak Ave'
-        }
+        overrides = _isolated(ORIGIN_ADDR='123 Main St', DEST_ADDR='456 Oak Ave')
+        config = load_config(env_file="nonexistent.env", overrides=overrides)
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = load_config(env_file="nonexistent.env")
-            
-            assert config.origin_addr == "123 Main St"
-            assert config.dest_addr == "456 Oak Ave"
-            # Should use defaults for other values
-            assert config.osrm_url == "https://router.project-osrm.org"
+        assert config.origin_addr == "123 Main St"
+        assert config.dest_addr == "456 Oak Ave"
+        # Should use defaults for other values
+        assert config.osrm_url == "https://router.project-osrm.org"
 
-    def test_environment_overrides_env_file(self):
+    def test_environment_overrides_env_file(self, tmp_path):
         """Test that environment variables override .env file values."""
         env_content = """
 ORIGIN_ADDR="File Origin"
@@ -186,23 +211,69 @@ DEST_ADDR="File Destination"
 LOG_LEVEL="ERROR"
         """.strip()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-            f.write(env_content)
-            env_file_path = f.name
+        env_file_path = tmp_path / "test.env"
+        env_file_path.write_text(env_content)
         
-        try:
-            env_vars = {
-                'ORIGIN_ADDR': 'Env Origin',
-                'LOG_LEVEL': 'DEBUG'
-            }
-            
-            with patch.dict(os.environ, env_vars, clear=False):
-                config = load_config(env_file=env_file_path)
+        env_vars = {
+            'ORIGIN_ADDR': 'Env Origin',
+            'LOG_LEVEL': 'DEBUG'
+        }
+        
+        with patch.dict(os.environ, env_vars, clear=False):
+            config = load_config(env_file=str(env_file_path))
+        
+        # Environment should override file
+        assert config.origin_addr == "Env Origin"
+        assert config.log_level == "DEBUG"
+        # File value should be used where env var not set
+        assert config.dest_addr == "File Destination"
+
+    def test_overrides_take_precedence_over_environment(self):
+        """Test that overrides win over environment variables without changing them."""
+        env_vars = {
+            'ORIGIN_ADDR': 'Env Origin',
+            'DEST_ADDR': 'Env Destination'
+        }
+        
+        with patch.dict(os.environ, env_vars, clear=False):
+            config = load_config(env_file="nonexistent.env", overrides={'ORIGIN_ADDR': 'Override Origin'})
             
-            # Environment should override file
-            assert config.origin_addr == "Env Origin"
-            assert config.log_level == "DEBUG"
-            # File value should be used where env var not set
-            assert config.dest_addr == "File Destination"
-        finally:
-            os.unlink(env_file_path)
\ No newline at end of file
+            assert os.environ['ORIGIN_ADDR'] == 'Env Origin'
+        
+        assert config.origin_addr == "Override Origin"
+        assert config.dest_addr == "Env Destination"
+
+    def test_empty_override_beats_env_file(self, tmp_path):
+        """Test that an override set to an empty string still wins over the file."""
+        env_file_path = tmp_path / "test.env"
+        env_file_path.write_text('ORIGIN_ADDR="A"\nDEST_ADDR="B"\nLLM_API_KEY="file-api-key"')
+        
+        config = load_config(env_file=str(env_file_path), overrides=_isolated(LLM_API_KEY=""))
+        
+        assert config.llm_api_key == ""
+
+    def test_env_file_reparsed_after_modification(self, tmp_path):
+        """Test that cached env file values are refreshed when the file changes."""
+        env_file_path = tmp_path / "test.env"
+        env_file_path.write_text('ORIGIN_ADDR="Old Origin"\nDEST_ADDR="Old Destination"')
+        
+        assert load_config(env_file=str(env_file_path), overrides=_isolated()).origin_addr == "Old Origin"
+        
+        mtime_ns = os.stat(env_file_path).st_mtime_ns
+        env_file_path.write_text('ORIGIN_ADDR="Newer Origin"\nDEST_ADDR="New Destination"')
+        # Simulate a coarse filesystem clock: the edit leaves the mtime unchanged
+        os.utime(env_file_path, ns=(mtime_ns, mtime_ns))
+        
+        assert load_config(env_file=str(env_file_path), overrides=_isolated()).origin_addr == "Newer Origin"
+
+    def test_load_config_is_cached_until_environment_changes(self):
+        """Test that repeated loads share one Config until an input changes."""
+        overrides = _isolated(ORIGIN_ADDR='123 Main St', DEST_ADDR='456 Oak Ave')
+        
+        first = load_config(env_file="nonexistent.env", overrides=overrides)
+        assert load_config(env_file="nonexistent.env", overrides=dict(overrides)) is first
+        
+        changed = load_config(env_file="nonexistent.env", overrides={**overrides, 'MAX_ROUTES': '5'})
+        
+        assert changed is not first
+        assert changed.max_routes == 5
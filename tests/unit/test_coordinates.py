@@ -1,6 +1,8 @@
 """Tests for coordinates model."""
+from dataclasses import astuple
+
+import numpy as np
 import pytest
-from pydantic import ValidationError
 
 from pathypotomus.models.coordinates import Coordinates
 
@@ -30,35 +32,23 @@ class TestCoordinates:
 
     def test_invalid_latitude_too_high(self):
         """Test validation error for latitude > 90."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="Latitude"):
             Coordinates(latitude=91.0, longitude=0.0)
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'latitude' for error in errors)
 
     def test_invalid_latitude_too_low(self):
         """Test validation error for latitude < -90."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="Latitude"):
             Coordinates(latitude=-91.0, longitude=0.0)
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'latitude' for error in errors)
 
     def test_invalid_longitude_too_high(self):
         """Test validation error for longitude > 180."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="Longitude"):
             Coordinates(latitude=0.0, longitude=181.0)
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'longitude' for error in errors)
 
     def test_invalid_longitude_too_low(self):
         """Test validation error for longitude < -180."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="Longitude"):
             Coordinates(latitude=0.0, longitude=-181.0)
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'longitude' for error in errors)
 
     def test_distance_calculation(self):
         """Test distance calculation between two coordinates."""
@@ -78,6 +68,77 @@ class TestCoordinates:
         
         assert distance == 0.0
 
+    def test_pairwise_distances_matches_scalar(self):
+        """Test vectorized distances agree with distance_to row by row."""
+        points_a = [
+            Coordinates(latitude=41.8781, longitude=-87.6298),
+            Coordinates(latitude=43.0389, longitude=-87.9065),
+            Coordinates(latitude=0.0, longitude=0.0),
+        ]
+        points_b = [
+            Coordinates(latitude=43.0389, longitude=-87.9065),
+            Coordinates(latitude=43.0389, longitude=-87.9065),
+            Coordinates(latitude=0.0, longitude=180.0),
+        ]
+        arr_a = np.array([p.to_tuple() for p in points_a])
+        arr_b = np.array([p.to_tuple() for p in points_b])
+        
+        distances = Coordinates.pairwise_distances(arr_a, arr_b)
+        
+        assert distances.shape == (3,)
+        expected = [a.distance_to(b) for a, b in zip(points_a, points_b)]
+        assert distances == pytest.approx(expected)
+
+    def test_haversine_array_from_columns(self):
+        """Test vectorized distances from separate latitude/longitude columns."""
+        chicago = Coordinates(latitude=41.8781, longitude=-87.6298)
+        milwaukee = Coordinates(latitude=43.0389, longitude=-87.9065)
+        
+        distances = Coordinates.haversine_array(
+            [chicago.latitude, chicago.latitude],
+            [chicago.longitude, chicago.longitude],
+            [milwaukee.latitude, chicago.latitude],
+            [milwaukee.longitude, chicago.longitude],
+        )
+        
+        assert distances == pytest.approx([chicago.distance_to(milwaukee), 0.0])
+
+    def test_vectorized_distances_reject_mismatched_shapes(self):
+        """Test batch entry points raise instead of reading past short inputs."""
+        with pytest.raises(ValueError):
+            Coordinates.haversine_array([1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [1.0], [1.0])
+        with pytest.raises(ValueError):
+            Coordinates.pairwise_distances(np.zeros((3, 2)), np.zeros((1, 2)))
+        with pytest.raises(ValueError):
+            Coordinates.pairwise_distances(np.zeros((3, 3)), np.zeros((3, 3)))
+
+    def test_model_validate_from_mapping(self):
+        """Test creating coordinates from a mapping of field values."""
+        coords = Coordinates.model_validate({"latitude": 41.8781, "longitude": -87.6298})
+        
+        assert coords == Coordinates(latitude=41.8781, longitude=-87.6298)
+
+    def test_build_trusted_matches_validated(self):
+        """Test the trusted constructor builds coordinates equal to validated ones."""
+        trusted = Coordinates.build_trusted(41.8781, -87.6298)
+        chicago = Coordinates(latitude=41.8781, longitude=-87.6298)
+        
+        assert trusted == chicago
+        assert trusted.distance_to(chicago) == 0.0
+
+    def test_coordinates_are_immutable(self):
+        """Test that coordinates cannot be modified after creation."""
+        coords = Coordinates(latitude=41.8781, longitude=-87.6298)
+        
+        with pytest.raises(AttributeError):
+            coords.latitude = 42.0
+
+    def test_astuple_has_only_latitude_and_longitude(self):
+        """Test that no internal fields leak into the dataclass field set."""
+        coords = Coordinates(latitude=41.8781, longitude=-87.6298)
+        
+        assert astuple(coords) == (41.8781, -87.6298)
+
     def test_string_representation(self):
         """Test string representation of coordinates."""
         coords = Coordinates(latitude=41.8781, longitude=-87.6298)
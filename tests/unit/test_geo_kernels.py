@@ -0,0 +1,56 @@
+"""Tests for batch geodesic kernels."""
+import numpy as np
+import pytest
+
+from pathypotomus.geo import _kernels
+from pathypotomus.models.coordinates import Coordinates
+
+
+@pytest.mark.parametrize("kernel", [_kernels.haversine_batch, _kernels._haversine_numpy])
+def test_haversine_batch_matches_distance_to(kernel):
+    """Test batch kernels agree with the scalar Haversine implementation."""
+    lat1 = np.array([41.8781, 43.0389, 0.0, 10.0])
+    lon1 = np.array([-87.6298, -87.9065, 0.0, 20.0])
+    lat2 = np.array([43.0389, 43.0389, 0.0, -10.0])
+    lon2 = np.array([-87.9065, -87.9065, 180.0, -160.0])
+    out = np.empty(4)
+
+    result = kernel(lat1, lon1, lat2, lon2, out)
+
+    assert result is out
+    expected = [
+        Coordinates(latitude=a, longitude=b).distance_to(Coordinates(latitude=c, longitude=d))
+        for a, b, c, d in zip(lat1, lon1, lat2, lon2)
+    ]
+    assert out == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("lat2, out", [
+    (np.zeros(1), np.empty(3)),
+    (np.zeros(3), np.empty(2)),
+    (np.zeros((3, 1)), np.empty(3)),
+])
+def test_haversine_batch_rejects_mismatched_shapes(lat2, out):
+    """Test inputs of differing length or rank raise instead of reading out of bounds."""
+    a = np.zeros(3)
+    with pytest.raises(ValueError):
+        _kernels.haversine_batch(a, a, lat2, a, out)
+
+
+def test_decode_polyline_matches_reference_example():
+    """Test the built-in decoder against the example in Google's format documentation."""
+    points = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+    encoded = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+
+    decoded = _kernels.decode_polyline(encoded)
+    decoded_py = _kernels._decode_polyline_loop(encoded.encode("ascii"), 1e5)
+
+    assert decoded.shape == (3, 2)
+    assert decoded == pytest.approx(np.array(points))
+    assert decoded_py == pytest.approx(np.array(points))
+
+
+def test_decode_polyline_rejects_truncated_input():
+    """Test a polyline cut off mid-value raises ValueError."""
+    with pytest.raises(ValueError):
+        _kernels._decode_polyline_loop(b"_p~iF~ps|U_", 1e5)
@@ -1,10 +1,9 @@
 import asyncio
-from typing import Any, Dict, Optional
+import json
+from typing import Any, Dict, Optional, Tuple
 
 import pytest
-import polyline as polyline_lib
 
-from pathypotomus.models.coordinates import Coordinates
 from pathypotomus.models.route import Route
 
 
@@ -12,10 +11,10 @@ from pathypotomus.models.route import Route
 class _FakeResponse:
     def __init__(self, status: int, json_data: Dict[str, Any]):
         self.status = status
-        self._json_data = json_data
+        self._body = json.dumps(json_data).encode()
 
-    async def json(self) -> Dict[str, Any]:
-        return self._json_data
+    async def read(self) -> bytes:
+        return self._body
 
     async def __aenter__(self):
         return self
@@ -26,30 +25,43 @@ class _FakeResponse:
 
 class _FakeSession:
     def __init__(self, status: int, json_data: Dict[str, Any]):
-        self._status = status
-        self._json_data = json_data
+        # Responses are stateless, so one instance serves every request
+        self._response = _FakeResponse(status, json_data)
         self.last_url: Optional[str] = None
         self.last_params: Optional[Dict[str, Any]] = None
 
     def get(self, url: str, params: Optional[Dict[str, Any]] = None):
         self.last_url = url
         self.last_params = params or {}
-        return _FakeResponse(self._status, self._json_data)
-
-
-# --- Fixtures ---
-@pytest.fixture
-def origin_coords() -> Coordinates:
-    return Coordinates(latitude=41.8781, longitude=-87.6298)
-
-
-@pytest.fixture
-def dest_coords() -> Coordinates:
-    return Coordinates(latitude=43.0389, longitude=-87.9065)
-
-
-def _make_osrm_route(geometry_points, distance: float, duration: float, step_names):
-    encoded = polyline_lib.encode([(p.latitude, p.longitude) for p in geometry_points])
+        return self._response
+
+
+# --- Canonical geometries, encoded once at import ---
+def _encode(points: Tuple[Tuple[float, float], ...]) -> str:
+    """Encode (lat, lon) points with Google's polyline algorithm at precision 5."""
+    chunks = []
+    prev_lat = prev_lon = 0
+    for lat, lon in points:
+        lat_e5, lon_e5 = round(lat * 1e5), round(lon * 1e5)
+        for delta in (lat_e5 - prev_lat, lon_e5 - prev_lon):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        prev_lat, prev_lon = lat_e5, lon_e5
+    return "".join(chunks)
+
+
+_ORIGIN = (41.8781, -87.6298)
+_DEST = (43.0389, -87.9065)
+_GEOM1_POINTS = (_ORIGIN, (42.0, -87.7), _DEST)
+_GEOM1_ENCODED = _encode(_GEOM1_POINTS)
+_GEOM2_ENCODED = _encode((_ORIGIN, (41.95, -87.75), _DEST))
+_DIRECT_ENCODED = _encode((_ORIGIN, _DEST))
+
+
+def _make_osrm_route(encoded: str, distance: float, duration: float, step_names):
     legs = [
         {
             "steps": [
@@ -65,6 +77,13 @@ def _make_osrm_route(geometry_points, distance: float, duration: float, step_nam
     }
 
 
+@pytest.fixture(scope="module")
+def five_route_response() -> Dict[str, Any]:
+    return _make_osrm_ok_response([
+        _make_osrm_route(_DIRECT_ENCODED, 1000.0 + i * 10.0, 100.0 + i * 5.0, [f"Road {i}"]) for i in range(5)
+    ])
+
+
 def _make_osrm_ok_response(routes: list[dict]) -> Dict[str, Any]:
     return {
         "code": "Ok",
@@ -82,12 +101,9 @@ def _make_osrm_error_response(message: str) -> Dict[str, Any]:
 @pytest.mark.asyncio
 async def test_get_routes_parses_response_into_route_models(origin_coords, dest_coords):
     # Two simple routes with distinct roads
-    geom1 = [origin_coords, Coordinates(latitude=42.0, longitude=-87.7), dest_coords]
-    geom2 = [origin_coords, Coordinates(latitude=41.95, longitude=-87.75), dest_coords]
-
     osrm_routes = [
-        _make_osrm_route(geom1, distance=150000.0, duration=5400.0, step_names=["I-94 N", "Lake Shore Drive", "Main St"]),
-        _make_osrm_route(geom2, distance=160000.0, duration=5600.0, step_names=["US-41", "I-94 N"]),
+        _make_osrm_route(_GEOM1_ENCODED, distance=150000.0, duration=5400.0, step_names=["I-94 N", "Lake Shore Drive", "Main St"]),
+        _make_osrm_route(_GEOM2_ENCODED, distance=160000.0, duration=5600.0, step_names=["US-41", "I-94 N"]),
     ]
 
     fake_session = _FakeSession(status=200, json_data=_make_osrm_ok_response(osrm_routes))
@@ -123,13 +139,8 @@ async def test_get_routes_parses_response_into_route_models(origin_coords, dest_
 
 
 @pytest.mark.asyncio
-async def test_get_routes_respects_max_alternatives(origin_coords, dest_coords):
-    geom = [origin_coords, dest_coords]
-    osrm_routes = [
-        _make_osrm_route(geom, 1000.0 + i * 10.0, 100.0 + i * 5.0, [f"Road {i}"]) for i in range(5)
-    ]
-
-    fake_session = _FakeSession(status=200, json_data=_make_osrm_ok_response(osrm_routes))
+async def test_get_routes_respects_max_alternatives(origin_coords, dest_coords, five_route_response):
+    fake_session = _FakeSession(status=200, json_data=five_route_response)
     from pathypotomus.services.osrm import OSRMService
 
     service = OSRMService(session=fake_session)
@@ -138,6 +149,49 @@ async def test_get_routes_respects_max_alternatives(origin_coords, dest_coords):
     assert len(routes) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_routes_without_steps_skips_major_roads(origin_coords, dest_coords):
+    osrm_routes = [_make_osrm_route(_DIRECT_ENCODED, 1000.0, 100.0, ["Main St"])]
+
+    fake_session = _FakeSession(status=200, json_data=_make_osrm_ok_response(osrm_routes))
+    from pathypotomus.services.osrm import OSRMService
+
+    service = OSRMService(session=fake_session)
+    routes = await service.get_routes(origin_coords, dest_coords, include_steps=False)
+
+    assert "steps" not in fake_session.last_params
+    assert routes[0].major_roads == []
+    assert routes[0].summary == ""
+
+
+@pytest.mark.asyncio
+async def test_get_routes_batch_returns_results_in_order(origin_coords, dest_coords):
+    osrm_routes = [_make_osrm_route(_DIRECT_ENCODED, 1000.0, 100.0, ["Main St"])]
+
+    fake_session = _FakeSession(status=200, json_data=_make_osrm_ok_response(osrm_routes))
+    from pathypotomus.services.osrm import OSRMService
+
+    service = OSRMService(session=fake_session)
+    results = await service.get_routes_batch(
+        [(origin_coords, dest_coords), (dest_coords, origin_coords)], max_concurrency=1
+    )
+
+    assert len(results) == 2
+    assert all(len(routes) == 1 for routes in results)
+
+
+@pytest.mark.asyncio
+async def test_get_routes_batch_returns_errors_per_pair(origin_coords, dest_coords):
+    fake_session = _FakeSession(status=503, json_data={})
+    from pathypotomus.services.osrm import OSRMService, RoutingError
+
+    service = OSRMService(session=fake_session)
+    results = await service.get_routes_batch([(origin_coords, dest_coords)] * 3)
+
+    assert len(results) == 3
+    assert all(isinstance(r, RoutingError) for r in results)
+
+
 @pytest.mark.asyncio
 async def test_get_routes_raises_on_http_error(origin_coords, dest_coords):
     fake_session = _FakeSession(status=503, json_data={})
@@ -157,4 +211,70 @@ async def test_get_routes_raises_on_osrm_error_code(origin_coords, dest_coords):
     service = OSRMService(session=fake_session)
 
     with pytest.raises(RoutingError):
-        await service.get_routes(origin_coords, dest_coords)
\ No newline at end of file
+        await service.get_routes(origin_coords, dest_coords)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_fast_decoder", [True, False])
+@pytest.mark.parametrize("encoded", ["_p~iF~ps|U_", _encode((_ORIGIN,))])
+async def test_get_routes_raises_on_invalid_geometry(monkeypatch, origin_coords, dest_coords, encoded, use_fast_decoder):
+    from pathypotomus.services import osrm
+    from pathypotomus.services.osrm import OSRMService, RoutingError
+
+    if not use_fast_decoder:
+        monkeypatch.setattr(osrm, "_fast_decode_polyline", None)
+    elif osrm._fast_decode_polyline is None:
+        pytest.skip("pypolyline is not installed")
+
+    osrm_routes = [_make_osrm_route(encoded, 1000.0, 100.0, ["Main St"])]
+    fake_session = _FakeSession(status=200, json_data=_make_osrm_ok_response(osrm_routes))
+
+    service = OSRMService(session=fake_session)
+
+    with pytest.raises(RoutingError):
+        await service.get_routes(origin_coords, dest_coords)
+
+
+@pytest.mark.parametrize("use_fast_decoder", [True, False])
+def test_decode_polyline_round_trips_coordinates(monkeypatch, use_fast_decoder):
+    from pathypotomus.services import osrm
+
+    if not use_fast_decoder:
+        monkeypatch.setattr(osrm, "_fast_decode_polyline", None)
+    elif osrm._fast_decode_polyline is None:
+        pytest.skip("pypolyline is not installed")
+
+    decoded = osrm.OSRMService()._decode_polyline(_GEOM1_ENCODED)
+
+    assert decoded.shape == (3, 2)
+    assert [tuple(row) for row in decoded.tolist()] == list(_GEOM1_POINTS)
+
+
+@pytest.mark.asyncio
+async def test_owned_session_is_reused_and_closed():
+    pytest.importorskip("aiohttp")
+    from pathypotomus.services.osrm import OSRMService
+
+    async with OSRMService() as service:
+        session = await service._ensure_session()
+        assert await service._ensure_session() is session
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_injected_session_takes_precedence():
+    fake_session = _FakeSession(status=200, json_data=_make_osrm_ok_response([]))
+    from pathypotomus.services.osrm import OSRMService
+
+    async with OSRMService(session=fake_session) as service:
+        assert await service._ensure_session() is fake_session
+
+
+def test_extract_major_roads_dedupes_and_caps_at_five():
+    from pathypotomus.services.osrm import OSRMService
+
+    names = ["I-94 N", "I-94 N", " ", "A", "US-41", "Main St", "US-41", "Oak Ave", "Elm St", "Pine Rd"]
+    legs = [{"steps": [{"name": n} for n in names[:5]]}, {"steps": [{"name": n} for n in names[5:]]}]
+
+    assert OSRMService()._extract_major_roads(legs) == ["I-94 N", "US-41", "Main St", "Oak Ave", "Elm St"]
@@ -1,22 +1,26 @@
 """Tests for route model."""
+import pickle
+from dataclasses import astuple, fields
 from typing import List
+import numpy as np
 import pytest
-from pydantic import ValidationError
 
 from pathypotomus.models.coordinates import Coordinates
 from pathypotomus.models.route import Route
 
+_GEOM2 = (
+    Coordinates(latitude=41.8781, longitude=-87.6298),
+    Coordinates(latitude=41.8850, longitude=-87.6350)
+)
+_GEOM3 = _GEOM2[:1] + (Coordinates(latitude=41.8800, longitude=-87.6300),) + _GEOM2[1:]
+
 
 class TestRoute:
     """Test route model validation and functionality."""
 
     def test_valid_route(self):
         """Test valid route creation."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8800, longitude=-87.6300),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM3)
         
         route = Route(
             geometry=geometry,
@@ -34,10 +38,7 @@ class TestRoute:
 
     def test_route_with_minimal_data(self):
         """Test route creation with minimal required data."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
         route = Route(
             geometry=geometry,
@@ -55,69 +56,73 @@ class TestRoute:
 
     def test_invalid_empty_geometry(self):
         """Test validation error for empty geometry."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="geometry"):
             Route(
                 geometry=[],
                 distance=1000.0,
                 duration=100.0
             )
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'geometry' for error in errors)
 
     def test_invalid_single_point_geometry(self):
         """Test validation error for single point geometry."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="geometry"):
             Route(
-                geometry=[Coordinates(latitude=41.8781, longitude=-87.6298)],
+                geometry=list(_GEOM2[:1]),
                 distance=1000.0,
                 duration=100.0
             )
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'geometry' for error in errors)
 
     def test_invalid_negative_distance(self):
         """Test validation error for negative distance."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="distance"):
             Route(
                 geometry=geometry,
                 distance=-1000.0,
                 duration=100.0
             )
-        
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'distance' for error in errors)
 
     def test_invalid_negative_duration(self):
         """Test validation error for negative duration."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError, match="duration"):
             Route(
                 geometry=geometry,
                 distance=1000.0,
                 duration=-100.0
             )
+
+    @pytest.mark.parametrize("geometry", [
+        [(100.0, 50.0), (0.0, 0.0)],
+        [(0.0, 0.0), (0.0, 500.0)],
+        np.array([[41.8781, -87.6298], [np.nan, -87.6350]]),
+        np.array([[41.8781, -87.6298], [41.8850, -200.0]]),
+    ])
+    def test_invalid_out_of_range_geometry(self, geometry):
+        """Test validation error for out-of-range pairs and array rows."""
+        with pytest.raises(ValueError, match="geometry"):
+            Route(geometry=geometry, distance=1000.0, duration=100.0)
+
+    def test_route_accepts_array_geometry(self):
+        """Test route creation from an (N, 2) array of lat/lon rows."""
+        geometry = np.array([[41.8781, -87.6298], [41.8850, -87.6350]])
+        
+        route = Route(geometry=geometry, distance=3000.0, duration=300.0)
         
-        errors = exc_info.value.errors()
-        assert any(error['loc'][0] == 'duration' for error in errors)
+        assert route.geometry_arr.shape == (2, 2)
+        assert route.geometry == list(_GEOM2)
+
+    def test_route_accepts_mixed_geometry(self):
+        """Test geometry mixing Coordinates and (lat, lon) pairs."""
+        route = Route(geometry=[_GEOM2[0], (41.8850, -87.6350)], distance=3000.0, duration=300.0)
+        
+        assert route.geometry == list(_GEOM2)
 
     def test_route_start_point(self):
         """Test getting the start point of a route."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8800, longitude=-87.6300),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM3)
         
         route = Route(
             geometry=geometry,
@@ -131,11 +136,7 @@ class TestRoute:
 
     def test_route_end_point(self):
         """Test getting the end point of a route."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8800, longitude=-87.6300),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM3)
         
         route = Route(
             geometry=geometry,
@@ -147,12 +148,28 @@ class TestRoute:
         assert end.latitude == 41.8850
         assert end.longitude == -87.6350
 
+    def test_route_coordinate_arrays(self):
+        """Test latitude/longitude columns and bulk operations on them."""
+        route = Route(
+            geometry=[(41.8781, -87.6298), (41.8800, -87.6300), (41.8850, -87.6350)],
+            distance=5000.0,
+            duration=600.0
+        )
+        
+        assert route.lats.flags.c_contiguous and route.lons.flags.c_contiguous
+        assert route.lats.tolist() == [41.8781, 41.8800, 41.8850]
+        assert route.lons.tolist() == [-87.6298, -87.6300, -87.6350]
+        
+        a, b, c = route.geometry
+        assert route.path_length_km() == pytest.approx(a.distance_to(b) + b.distance_to(c))
+        
+        south_west, north_east = route.bounding_box()
+        assert south_west == Coordinates(latitude=41.8781, longitude=-87.6350)
+        assert north_east == Coordinates(latitude=41.8850, longitude=-87.6298)
+
     def test_route_distance_formatted(self):
         """Test formatted distance display."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
         # Test kilometers
         route_km = Route(
@@ -172,10 +189,7 @@ class TestRoute:
 
     def test_route_duration_formatted(self):
         """Test formatted duration display."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
         # Test hours and minutes
         route_long = Route(
@@ -203,10 +217,7 @@ class TestRoute:
 
     def test_route_with_ai_generated_content(self):
         """Test route with AI-generated name and description."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
         route = Route(
             geometry=geometry,
@@ -221,14 +232,8 @@ class TestRoute:
 
     def test_route_equality(self):
         """Test route equality comparison."""
-        geometry1 = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
-        geometry2 = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry1 = list(_GEOM2)
+        geometry2 = list(_GEOM2)
         geometry3 = [
             Coordinates(latitude=42.0, longitude=-87.0),
             Coordinates(latitude=42.1, longitude=-87.1)
@@ -241,12 +246,59 @@ class TestRoute:
         assert route1 == route2
         assert route1 != route3
 
+    def test_route_hashable(self):
+        """Test that equal routes collapse to one entry in a set."""
+        geometry = list(_GEOM2)
+        
+        route1 = Route(geometry=geometry, distance=5000.0, duration=600.0)
+        route2 = Route(geometry=list(geometry), distance=5000.0, duration=600.0)
+        route3 = Route(geometry=geometry, distance=6000.0, duration=600.0)
+        
+        assert len({route1, route2, route3}) == 2
+
+    def test_build_trusted_matches_validated_route(self):
+        """Test the trusted constructor builds a route equal to the validated one."""
+        points = [(41.8781, -87.6298), (41.8850, -87.6350)]
+        
+        trusted = Route.build_trusted(np.array(points), 5000.0, 600.0, summary="via Main St")
+        validated = Route(geometry=points, distance=5000.0, duration=600.0, summary="via Main St")
+        
+        assert trusted == validated
+        assert hash(trusted) == hash(validated)
+        assert trusted.major_roads == []
+        assert trusted.name is None and trusted.description is None
+        assert trusted.distance_formatted == "5.0 km"
+        assert not trusted.geometry_arr.flags.writeable
+
+    def test_fields_exclude_internal_caches(self):
+        """Test that cached values stay out of the dataclass field set and survive pickling."""
+        route = Route(geometry=list(_GEOM2), distance=5000.0, duration=600.0, summary="via Main St")
+        
+        assert [f.name for f in fields(route)] == [
+            "geometry", "distance", "duration", "summary", "major_roads", "name", "description"
+        ]
+        assert len(astuple(route)) == 7
+        
+        restored = pickle.loads(pickle.dumps(route))
+        assert restored == route
+        assert restored.distance_formatted == "5.0 km"
+
+    def test_route_is_immutable(self):
+        """Test that routes cannot be modified after creation."""
+        route = Route(
+            geometry=list(_GEOM2),
+            distance=5000.0,
+            duration=600.0
+        )
+        
+        with pytest.raises(AttributeError):
+            route.distance = 1.0
+        with pytest.raises(ValueError):
+            route.geometry_arr[0, 0] = 0.0
+
     def test_route_string_representation(self):
         """Test string representation of route."""
-        geometry = [
-            Coordinates(latitude=41.8781, longitude=-87.6298),
-            Coordinates(latitude=41.8850, longitude=-87.6350)
-        ]
+        geometry = list(_GEOM2)
         
         route = Route(
             geometry=geometry,